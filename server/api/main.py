@@ -1,10 +1,12 @@
 # server/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Response, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from server.db.connection import init_db
+from server.templates_env import prime_templates, templates
 from server.views.rolodex import router as rolodex_router
 from server.views.yellowpages import router as yellowpages_router
 from server.views.admin import router as admin_router
@@ -12,7 +14,28 @@ from server.views.auth import router as auth_view_router
 from server.views.misc import router as misc_router
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Compile the hot templates ahead of the first request.
+
+    Includes and imports load lazily at render time, so the public
+    listing's partials are primed alongside the pages themselves.
+    """
+    prime_templates(
+        "yellowpages.html",
+        "base.html",
+        "partials/_nav.html",
+        "partials/_filter_form.html",
+        "partials/_entry_card.html",
+        "partials/_pagination.html",
+        "macros/filters.html",
+        "admin_panel.html",
+        "edit_entry_admin.html",
+    )
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 init_db()
 
 app.mount("/static", StaticFiles(directory="server/static"), name="static")
@@ -24,8 +47,6 @@ app.include_router(admin_router)
 app.include_router(auth_view_router)
 app.include_router(misc_router)
 
-templates = Jinja2Templates(directory="server/templates")
-
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     status = exc.status_code
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from server.settings import settings
@@ -9,10 +9,41 @@ from server.models.entities import Entry, User  # Ensure models are registered
 
 DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Size the pool for concurrent request threads so checkouts don't queue
+# behind a 5-connection default under bursty traffic. LIFO reuse keeps the
+# hot connections (and their page caches) busy. Network-oriented knobs like
+# pool_pre_ping/pool_recycle are deliberately absent: an embedded SQLite
+# file has no connections that can silently drop.
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=20,
+    max_overflow=10,
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each pooled connection once at checkout into the pool.
+
+    WAL lets readers proceed during a write and makes commits an append
+    instead of a journal rewrite; synchronous=NORMAL drops the fsync per
+    commit (WAL still survives process crashes); the larger page cache
+    (64 MB) and in-memory temp store keep repeat listing queries off disk.
+    Pragmas are per-connection (except the persistent journal mode), so
+    they run on connect rather than per request.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 def init_db():
     Base.metadata.create_all(bind=engine)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Table, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index, Table, DateTime, func, text
 from sqlalchemy.orm import relationship
 from server.db.connection import Base
 
@@ -6,7 +6,9 @@ entry_tags = Table(
     'entry_tags',
     Base.metadata,
     Column('entry_id', Integer, ForeignKey('entries.id'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True)
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+    # Reverse of the composite PK so tag-filtered listings can join tag -> entries.
+    Index('ix_entry_tags_tag_entry', 'tag_id', 'entry_id')
 )
 
 class User(Base):
@@ -29,6 +31,15 @@ class Tag(Base):
 
 class Entry(Base):
     __tablename__ = 'entries'
+    __table_args__ = (
+        # Partial covering index for the rolodex hot path: live personal
+        # entries by owner, already ordered for the id DESC page scan.
+        Index(
+            'ix_entries_user_live',
+            'user_id', 'id',
+            sqlite_where=text('is_deleted = 0 AND is_public_copy = 0'),
+        ),
+    )
 
     # Core content
     id = Column(Integer, primary_key=True, index=True)
@@ -1,19 +1,139 @@
-from typing import Optional
+import hashlib
+import time
+from typing import NamedTuple, Optional
 
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import Request, Depends, HTTPException, status
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 
 from server.db.connection import get_db
 from server.models.entities import User
 from server.settings import settings
+from server.utils.cache import TTLCache
 
-SECRET_KEY = settings.SECRET_KEY
+# Encoded once at import so the HS256 signer gets key bytes directly
+# instead of re-encoding the settings string on every token operation.
+SECRET_KEY = settings.SECRET_KEY.encode()
 ALGORITHM = settings.ALGORITHM
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Prebuilt key object: jose otherwise re-runs jwk.construct (key parsing
+# and algorithm-table lookup) on every encode/decode call.
+_SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+
+# Password hashing: Argon2id via argon2-cffi directly, skipping passlib's
+# per-call scheme dispatch. Legacy bcrypt rows stay verifiable through the
+# bcrypt backend and re-hash on the next successful login.
+_hasher = PasswordHasher(
+    memory_cost=65536,  # KiB; tune down if login breaches its latency budget
+    time_cost=3,
+    parallelism=4,
+)
+
+# Hashed once at import and verified against on unknown-username logins,
+# so hits and misses cost the same Argon2 work and response timing can't
+# be used to enumerate valid usernames.
+_DUMMY_HASH = _hasher.hash("hyperindex-dummy-password")
+
+# Decoded-claims cache: signature verification runs once per token per TTL
+# window instead of once per request. Keys are SHA-256 digests so a memory
+# dump of the cache never exposes a usable bearer token.
+_claims_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+
+# Token-to-user-id cache: skips the username lookup query per request on
+# top of the claims cache, leaving only a primary-key get for the entity.
+# Invalid tokens cache the 0 sentinel so repeated bad cookies stay O(1).
+_user_id_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+_INVALID_TOKEN = 0
+
+
+def decode_token(token: str) -> dict:
+    """
+    Decode and verify a JWT, caching the claims for a short window.
+
+    Args:
+        token (str): Encoded JWT token string.
+
+    Returns:
+        dict: Decoded claims.
+
+    Raises:
+        JWTError: If the token is invalid or expired.
+    """
+    # Reject structural garbage (stale or foreign cookies) before paying
+    # for the digest and signature check.
+    if token.count(".") != 2:
+        raise JWTError("Not enough segments")
+    key = hashlib.sha256(token.encode()).digest()
+    claims = _claims_cache.get(key)
+    if claims is None:
+        claims = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
+        ttl = None
+        exp = claims.get("exp")
+        if exp is not None:
+            # Never serve cached claims past the token's own expiry.
+            ttl = min(settings.AUTH_CACHE_TTL, exp - time.time())
+        if ttl is None or ttl > 0:
+            _claims_cache.set(key, claims, ttl)
+    return claims
+
+class UserCtx(NamedTuple):
+    """
+    Render-only user context built straight from signed token claims.
+
+    Carries the fields the templates read (nav bar, greetings) without a
+    database round-trip; handlers that mutate state keep loading the real
+    User entity through get_current_user.
+    """
+
+    id: int
+    username: str
+    is_admin: bool
+
+
+def _resolve_user_id(token: str, db: Session) -> Optional[int]:
+    """
+    Map an access token to its user id, caching the result briefly.
+
+    Args:
+        token (str): Encoded JWT token string.
+        db (Session): SQLAlchemy session for the fallback username lookup.
+
+    Returns:
+        Optional[int]: The user's id, or None for invalid tokens and
+        unknown users.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    user_id = _user_id_cache.get(key)
+    if user_id is None:
+        username = None
+        try:
+            username = decode_token(token).get("sub")
+        except JWTError:
+            pass
+        if username is not None:
+            user_id = db.execute(
+                select(User.id).where(User.username == username)
+            ).scalar_one_or_none()
+        _user_id_cache.set(key, user_id or _INVALID_TOKEN)
+    return user_id or None
+
+
+def hash_password(password: str) -> str:
+    """
+    Hash a plaintext password with the current scheme (Argon2id).
+
+    Args:
+        password (str): The plaintext password to hash.
+
+    Returns:
+        str: Encoded Argon2id hash.
+    """
+    return _hasher.hash(password)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -26,8 +146,51 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches, False otherwise.
     """
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    # Legacy bcrypt row from before the Argon2 migration.
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        return False
+
+
+def dummy_verify(password: str) -> None:
+    """
+    Burn one Argon2 verify against a throwaway hash.
+
+    Called on the unknown-username login path so it takes as long as a
+    real password check; the result is discarded.
+
+    Args:
+        password (str): The submitted plaintext password.
+    """
+    try:
+        _hasher.verify(_DUMMY_HASH, password)
+    except (VerificationError, InvalidHashError):
+        pass
+
+
+def rehash_if_needed(password: str, hashed_password: str) -> Optional[str]:
+    """
+    Produce a fresh hash when the stored one uses an outdated scheme.
+
+    Called after a successful login, while the plaintext is available, so
+    legacy bcrypt rows and stale Argon2 parameters migrate transparently.
 
-    return pwd_context.verify(plain_password, hashed_password)
+    Args:
+        password (str): The just-verified plaintext password.
+        hashed_password (str): The stored hash it verified against.
+
+    Returns:
+        Optional[str]: A replacement hash, or None if the stored one is current.
+    """
+    if not hashed_password.startswith("$argon2") or _hasher.check_needs_rehash(hashed_password):
+        return _hasher.hash(password)
+    return None
 
 
 def create_token(data: dict[str, str]) -> str:
@@ -41,7 +204,7 @@ def create_token(data: dict[str, str]) -> str:
         str: Encoded JWT token string.
     """
 
-    return jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(data, _SIGNING_KEY, algorithm=ALGORITHM)
 
 
 def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
@@ -63,15 +226,11 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing token")
 
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    except JWTError:
+    user_id = _resolve_user_id(token, db)
+    if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.query(User).filter(User.username == username).first()
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
@@ -87,19 +246,26 @@ def get_optional_user(access_token: Optional[str], db: Session) -> Optional[User
         db (Session): SQLAlchemy session for user lookup.
 
     Returns:
-        Optional[User]: User object if token is valid and user exists, else None.
+        Optional[User]: A UserCtx built from the token claims when present,
+        the User entity for legacy tokens, or None if the token is invalid.
     """
 
     if not access_token:
         return None
+    # Tokens minted since the uid/is_admin claims were added satisfy the
+    # render path from the signature alone; older ones fall back to the
+    # cached lookup.
     try:
-        payload = jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
-        username = payload.get("sub")
-        if username:
-            return db.query(User).filter_by(username=username).first()
+        claims = decode_token(access_token)
     except JWTError:
         return None
-    
+    if "uid" in claims:
+        return UserCtx(claims["uid"], claims["sub"], claims.get("is_admin", False))
+    user_id = _resolve_user_id(access_token, db)
+    return db.get(User, user_id) if user_id is not None else None
+
+
+
 def require_admin(user: User = Depends(get_current_user)) -> User:
     """
     Dependency that enforces admin-level access.
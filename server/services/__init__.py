@@ -0,0 +1,11 @@
+from server.services.admin import AdminEntryService
+from server.services.shared import EntryQueryService, SharedEntryService, TagService
+from server.services.user import UserEntryService
+
+__all__ = [
+    "AdminEntryService",
+    "EntryQueryService",
+    "SharedEntryService",
+    "TagService",
+    "UserEntryService",
+]
@@ -1,13 +1,23 @@
 from datetime import datetime, timezone
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, lambda_stmt, literal, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 from fastapi import HTTPException
 
-from server.models.entities import Entry, User
+from server.models.entities import Entry, User, entry_tags
 from server.models.schemas import EntryCreate
 from server.services.shared import TagService
 
+# Row filters for the three admin dashboard tabs.
+PENDING_FILTER = (
+    Entry.submitted_to_public == True,
+    Entry.is_public_copy == False,
+    Entry.is_deleted == False,
+)
+PUBLIC_FILTER = (Entry.is_public_copy == True, Entry.is_deleted == False)
+DELETED_FILTER = (Entry.is_public_copy == True, Entry.is_deleted == True)
+
 
 class AdminEntryService:
     """
@@ -27,23 +37,38 @@ class AdminEntryService:
         Raises:
             HTTPException: If entry not found or already approved.
         """
-        entry = db.get(Entry, entry_id)
-        if not entry:
+        row = db.query(Entry.id, Entry.is_public_copy).filter(Entry.id == entry_id).first()
+        if not row:
             raise HTTPException(status_code=404, detail="Entry not found")
-        if entry.is_public_copy:
+        if row.is_public_copy:
             raise HTTPException(status_code=400, detail="Entry already approved")
 
-        admin_entry = Entry(
-            title=entry.title,
-            url=entry.url,
-            notes=entry.notes,
-            user_id=admin_user.id,
-            is_public_copy=True,
-            original_id=entry.id,
-            tags=entry.tags[:],  # clone tag references
+        # Clone row and tag links server-side: one INSERT ... SELECT each,
+        # instead of loading the entry and issuing one tag-link INSERT per tag.
+        new_id = db.execute(
+            insert(Entry)
+            .from_select(
+                ["title", "url", "notes", "user_id", "is_public_copy",
+                 "submitted_to_public", "is_deleted", "original_id"],
+                select(
+                    Entry.title, Entry.url, Entry.notes,
+                    literal(admin_user.id), literal(True),
+                    literal(False), literal(False), Entry.id,
+                ).where(Entry.id == entry_id),
+            )
+            .returning(Entry.id)
+        ).scalar()
+        db.execute(
+            insert(entry_tags).from_select(
+                ["entry_id", "tag_id"],
+                select(literal(new_id), entry_tags.c.tag_id).where(
+                    entry_tags.c.entry_id == entry_id
+                ),
+            )
+        )
+        db.query(Entry).filter(Entry.id == entry_id).update(
+            {"submitted_to_public": False}, synchronize_session=False
         )
-        db.add(admin_entry)
-        entry.submitted_to_public = False
         db.commit()
 
     @staticmethod
@@ -67,31 +92,53 @@ class AdminEntryService:
         db.commit()
 
     @staticmethod
-    def update_entry(db: Session, entry_id: int, data: EntryCreate) -> Entry:
+    def update_entry(db: Session, entry_id: int, data: EntryCreate) -> None:
         """
         Update metadata and tags of an admin-managed public entry.
 
+        Writes the column changes as one core UPDATE (no entity load or flush)
+        and reconciles the tag links with set-difference statements, instead
+        of loading the entry and replacing its tag collection through the ORM.
+
         Args:
             entry_id (int): ID of the public entry to update.
             data (EntryCreate): Updated entry data.
 
-        Returns:
-            Entry: The updated Entry instance.
-
         Raises:
             HTTPException: If the entry doesn't exist or isn't admin-owned.
         """
-        entry = db.get(Entry, entry_id)
-        if not entry or not entry.is_public_copy:
+        result = db.execute(
+            update(Entry)
+            .where(Entry.id == entry_id, Entry.is_public_copy == True)
+            .values(title=data.title, url=data.url, notes=data.notes)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.rollback()
             raise HTTPException(status_code=404, detail="Admin-managed entry not found")
 
-        entry.title = data.title
-        entry.url = data.url
-        entry.notes = data.notes
-        entry.tags = TagService.resolve_tags(db, data.tags or [])
+        new_ids = {tag.id for tag in TagService.resolve_tags(db, data.tags or [])}
+        current_ids = {
+            row.tag_id
+            for row in db.execute(
+                select(entry_tags.c.tag_id).where(entry_tags.c.entry_id == entry_id)
+            )
+        }
+        to_add = new_ids - current_ids
+        to_remove = current_ids - new_ids
+        if to_add:
+            db.execute(
+                insert(entry_tags),
+                [{"entry_id": entry_id, "tag_id": tag_id} for tag_id in to_add],
+            )
+        if to_remove:
+            db.execute(
+                entry_tags.delete().where(
+                    entry_tags.c.entry_id == entry_id,
+                    entry_tags.c.tag_id.in_(to_remove),
+                )
+            )
         db.commit()
-        db.refresh(entry)
-        return entry
 
 
     @staticmethod
@@ -131,65 +178,87 @@ class AdminEntryService:
         db.commit()
 
     @staticmethod
-    def get_pending_submissions(db: Session, limit: int = 10, offset: int = 0) -> Tuple[List[Entry], int]:
+    def _list_entries(
+        db: Session, filters: tuple, limit: int, before: Optional[int]
+    ) -> Tuple[List[Entry], Optional[int], int]:
+        # COUNT(*) OVER () rides along on the page query, so rows and total
+        # arrive in one statement. With a cursor set it counts the rows at or
+        # below the cursor, i.e. how many entries remain from here.
+        # The admin cards render each entry's tags and owner; eager-load both
+        # so the template doesn't fire a lazy SELECT per row.
+        # lambda_stmt caches the constructed statement per filter tuple (the
+        # tuples are module-level constants), so repeat hits only rebind
+        # limit/cursor parameters instead of rebuilding the query.
+        fetch = limit + 1  # one extra row to learn whether an older page exists
+        stmt = lambda_stmt(
+            lambda: select(Entry, func.count().over().label("total"))
+            .options(selectinload(Entry.tags), joinedload(Entry.owner))
+            .where(*filters)
+            .order_by(Entry.id.desc()),
+            track_on=[filters],
+        )
+        if before is not None:
+            stmt += lambda s: s.where(Entry.id < before)
+        stmt += lambda s: s.limit(fetch)
+        rows = db.execute(stmt).all()
+        entries = [row[0] for row in rows[:limit]]
+        total = rows[0].total if rows else 0
+        next_before = entries[-1].id if len(rows) > limit else None
+        return entries, next_before, total
+
+    @staticmethod
+    def get_pending_submissions(
+        db: Session, limit: int = 10, before: Optional[int] = None
+    ) -> Tuple[List[Entry], Optional[int], int]:
         """
-        Retrieve paginated entries submitted by users for public review.
+        Retrieve entries submitted by users for public review, newest first.
+
+        Args:
+            before (Optional[int]): Keyset cursor; only entries with a smaller
+                id are returned.
 
         Returns:
-            Tuple[List[Entry], int]: List of entries and total count.
-        """
-        query = (
-            db.query(Entry)
-            .filter(
-                Entry.submitted_to_public == True,
-                Entry.is_public_copy == False,
-                Entry.is_deleted == False
-            )
-            .order_by(Entry.title.asc())
-        )
-        total = query.count()
-        entries = query.offset(offset).limit(limit).all()
-        return entries, total
+            Tuple[List[Entry], Optional[int], int]: Page of pending entries,
+            the cursor for the next (older) page (None on the last page), and
+            the total count from the cursor onward.
+        """
+        return AdminEntryService._list_entries(db, PENDING_FILTER, limit, before)
 
     @staticmethod
-    def get_public_entries(db: Session, limit: int = 10, offset: int = 0) -> Tuple[List[Entry], int]:
+    def get_public_entries(
+        db: Session, limit: int = 10, before: Optional[int] = None
+    ) -> Tuple[List[Entry], Optional[int], int]:
         """
-        Retrieve paginated list of active public (admin-approved) entries.
+        Retrieve active public (admin-approved) entries, newest first.
+
+        Args:
+            before (Optional[int]): Keyset cursor; only entries with a smaller
+                id are returned.
 
         Returns:
-            Tuple[List[Entry], int]: List of entries and total count.
+            Tuple[List[Entry], Optional[int], int]: Page of public entries,
+            the cursor for the next (older) page (None on the last page), and
+            the total count from the cursor onward.
         """
-        query = (
-            db.query(Entry)
-            .filter(
-                Entry.is_public_copy == True,
-                Entry.is_deleted == False
-            )
-            .order_by(Entry.title.asc())
-        )
-        total = query.count()
-        entries = query.offset(offset).limit(limit).all()
-        return entries, total
+        return AdminEntryService._list_entries(db, PUBLIC_FILTER, limit, before)
 
     @staticmethod
-    def get_deleted_entries(db: Session, limit: int = 10, offset: int = 0) -> Tuple[List[Entry], int]:
+    def get_deleted_entries(
+        db: Session, limit: int = 10, before: Optional[int] = None
+    ) -> Tuple[List[Entry], Optional[int], int]:
         """
-        Retrieve paginated list of deleted public entries (soft-deleted).
+        Retrieve soft-deleted public entries, newest first.
+
+        Args:
+            before (Optional[int]): Keyset cursor; only entries with a smaller
+                id are returned.
 
         Returns:
-            Tuple[List[Entry], int]: List of entries and total count.
+            Tuple[List[Entry], Optional[int], int]: Page of deleted entries,
+            the cursor for the next (older) page (None on the last page), and
+            the total count from the cursor onward.
         """
-        query = (
-            db.query(Entry)
-            .filter(
-                Entry.is_public_copy == True,
-                Entry.is_deleted == True
-            )
-            .order_by(Entry.title.asc())
-        )
-        total = query.count()
-        entries = query.offset(offset).limit(limit).all()
-        return entries, total
+        return AdminEntryService._list_entries(db, DELETED_FILTER, limit, before)
 
     @staticmethod
     def get_entry_for_edit(db: Session, entry_id: int) -> Entry:
@@ -202,7 +271,9 @@ class AdminEntryService:
         Raises:
             HTTPException: If the entry is not found or not public.
         """
-        entry = db.get(Entry, entry_id)
+        # The edit form renders entry.tags; load them up front instead of
+        # lazily during template rendering.
+        entry = db.get(Entry, entry_id, options=[selectinload(Entry.tags)])
         if not entry or not entry.is_public_copy:
             raise HTTPException(status_code=404, detail="Entry not found")
         return entry
\ No newline at end of file
@@ -0,0 +1,55 @@
+from typing import Optional, Tuple
+
+from server.utils.cache import TTLCache
+
+# Rendered-page cache for anonymous hits on the public listing: the same
+# query parameters produce the same HTML for every signed-out visitor, so
+# a hit skips both the SQL and the Jinja render. Keys are namespaced by a
+# version counter that the admin moderation actions bump, so invalidation
+# is one integer increment and stale entries simply stop being reachable;
+# the short TTL bounds staleness if an invalidation path is ever missed.
+_page_cache = TTLCache(maxsize=512, ttl=30)
+_version = 0
+
+
+def get_cached_listing(key: Tuple) -> Optional[bytes]:
+    """
+    Return the cached rendered page for `key`, or None on a miss.
+
+    Args:
+        key (Tuple): Hashable request parameters (q, tag, page, ...).
+
+    Returns:
+        Optional[bytes]: Cached HTML body, or None.
+    """
+    return _page_cache.get((_version, key))
+
+
+def store_listing(key: Tuple, body: bytes) -> None:
+    """
+    Cache the rendered page body under `key` for the current version.
+
+    Args:
+        key (Tuple): Hashable request parameters (q, tag, page, ...).
+        body (bytes): Rendered HTML body.
+    """
+    _page_cache.set((_version, key), body)
+
+
+def listing_version() -> int:
+    """
+    Return the current listing version.
+
+    Bumped on every public-entry mutation; doubles as the freshness token
+    in the listing ETags, so a 304 revalidation is one integer compare.
+
+    Returns:
+        int: Monotonic version counter.
+    """
+    return _version
+
+
+def invalidate_listings() -> None:
+    """Drop every cached listing page after a public-entry mutation."""
+    global _version
+    _version += 1
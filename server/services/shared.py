@@ -1,11 +1,83 @@
 from typing import List, Optional, Tuple
 
 from fastapi import HTTPException
-from sqlalchemy import or_, text
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import column, func, or_, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import NoResultFound
 
-from server.models.entities import Entry, Tag
+from server.models.entities import Entry, Tag, entry_tags
+
+_fts5_available: Optional[bool] = None
+
+# FTS statements built once at import: constructing and compiling a
+# TextClause per request is avoidable work, and reusing the same string
+# object lets the sqlite3 driver's per-connection statement cache hit
+# instead of re-preparing the query plan.
+# COUNT(*) OVER () streams the total alongside the page ids, so the FTS
+# join plan runs once instead of once for rows and once for count.
+_PUBLIC_FTS_SQL = text("""
+    SELECT e.id, COUNT(*) OVER () AS total
+    FROM (
+        SELECT rowid
+        FROM entry_fts
+        WHERE entry_fts MATCH :query
+    ) fts
+    JOIN entries e ON e.id = fts.rowid
+    WHERE e.is_public_copy = 1 AND e.is_deleted = 0
+    ORDER BY e.id DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+_FTS_ID_SQL = (
+    text("SELECT rowid FROM entry_fts WHERE entry_fts MATCH :fts_query")
+    .columns(column("rowid"))
+)
+
+
+def fts_match_query(query: str) -> str:
+    """
+    Turn raw user input into a safe FTS5 MATCH expression.
+
+    FTS5 treats quotes, dashes, parentheses, and words like NEAR as query
+    syntax, so passing input through verbatim turns ordinary searches
+    ("don't", "-foo") into OperationalErrors. Each whitespace-separated
+    token is wrapped as a quoted string with embedded quotes doubled, and
+    the last token gets a * suffix so partial words still match via the
+    prefix index.
+
+    Args:
+        query (str): Raw search input.
+
+    Returns:
+        str: Sanitized MATCH expression; an empty phrase (matches nothing)
+        when the input has no tokens.
+    """
+    tokens = ['"%s"' % token.replace('"', '""') for token in query.split()]
+    if not tokens:
+        return '""'
+    tokens[-1] += "*"
+    return " ".join(tokens)
+
+
+def fts_enabled(db: Session) -> bool:
+    """
+    Check whether the SQLite FTS5 module is available, caching the result.
+
+    Args:
+        db (Session): Database session used for the one-time probe.
+
+    Returns:
+        bool: True if FTS5 is compiled into the SQLite build.
+    """
+    global _fts5_available
+    if _fts5_available is None:
+        try:
+            modules = db.execute(text("SELECT name FROM pragma_module_list")).scalars().all()
+            _fts5_available = "fts5" in modules
+        except Exception:
+            _fts5_available = False
+    return _fts5_available
 
 
 class TagService:
@@ -25,15 +97,25 @@ class TagService:
         Returns:
             List[Tag]: List of resolved or newly created Tag instances.
         """
-        tag_objects = []
-        for tag_name in tags:
-            tag = db.query(Tag).filter_by(name=tag_name).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                db.add(tag)
-                db.flush()
-            tag_objects.append(tag)
-        return tag_objects
+        # Resolve the whole batch in at most three statements (lookup, bulk
+        # insert, lookup of the inserted rows) instead of a SELECT and
+        # possible INSERT per tag. ON CONFLICT DO NOTHING makes the insert
+        # safe against a concurrent request creating the same tag.
+        names = list(dict.fromkeys(name for name in tags if name))
+        if not names:
+            return []
+
+        existing = {tag.name: tag for tag in db.query(Tag).filter(Tag.name.in_(names))}
+        missing = [name for name in names if name not in existing]
+        if missing:
+            db.execute(
+                sqlite_insert(Tag)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            for tag in db.query(Tag).filter(Tag.name.in_(missing)):
+                existing[tag.name] = tag
+        return [existing[name] for name in names]
 
 
 class SharedEntryService:
@@ -55,7 +137,9 @@ class SharedEntryService:
         Raises:
             NoResultFound: If entry is not found or does not belong to the user.
         """
-        query = db.query(Entry).options(joinedload(Entry.tags)).filter(Entry.id == entry_id)
+        # selectinload fetches the tag collection with one IN query instead of
+        # a row-multiplying LEFT JOIN or a lazy SELECT at render time.
+        query = db.query(Entry).options(selectinload(Entry.tags)).filter(Entry.id == entry_id)
         if user_id is not None:
             query = query.filter(Entry.user_id == user_id)
         entry = query.first()
@@ -84,29 +168,22 @@ class SharedEntryService:
         Returns:
             Tuple[List[Entry], int]: List of matched entries and total result count.
         """
-        sql = text("""
-            SELECT e.id
-            FROM (
-                SELECT rowid
-                FROM entry_fts
-                WHERE entry_fts MATCH :query
-            ) fts
-            JOIN entries e ON e.id = fts.rowid
-            WHERE e.is_public_copy = 1 AND e.is_deleted = 0
-            ORDER BY e.id DESC
-            LIMIT :limit OFFSET :offset
-        """)
-        id_rows = db.execute(sql, {
-            "query": query,
+        id_rows = db.execute(_PUBLIC_FTS_SQL, {
+            "query": fts_match_query(query),
             "limit": limit,
             "offset": offset
         }).fetchall()
 
-        ids = [row[0] for row in id_rows]
-        if not ids:
+        if not id_rows:
             return [], 0
+        ids = [row.id for row in id_rows]
+        total = id_rows[0].total
 
-        entries_query = db.query(Entry).filter(Entry.id.in_(ids))
+        # The result cards render entry.tags; selectinload batches the tag
+        # fetch into one IN query instead of one lazy SELECT per entry.
+        entries_query = (
+            db.query(Entry).options(selectinload(Entry.tags)).filter(Entry.id.in_(ids))
+        )
         if sort == "alpha":
             entries_query = entries_query.order_by(Entry.title.asc())
         else:
@@ -114,20 +191,92 @@ class SharedEntryService:
 
         entries = entries_query.all()
 
-        count_sql = text("""
-            SELECT COUNT(*)
-            FROM (
-                SELECT rowid
-                FROM entry_fts
-                WHERE entry_fts MATCH :query
-            ) fts
-            JOIN entries e ON e.id = fts.rowid
-            WHERE e.is_public_copy = 1 AND e.is_deleted = 0
-        """)
-        total = db.execute(count_sql, {"query": query}).scalar()
-
         return entries, total
     
+    @staticmethod
+    def list_public_cards(
+        db: Session,
+        page: int = 1,
+        per_page: int = 10,
+        sort: str = "recent",
+        before: Optional[int] = None,
+        tag: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[int], Optional[int]]:
+        """
+        Fetch a page of public entries as plain card dicts.
+
+        The public cards render only id, title, url, notes, and tag names,
+        so this selects exactly those columns and folds the tags in with
+        group_concat - no Entry instances, no relationship loading, and no
+        per-row attribute instrumentation. Pagination mirrors the entity
+        path: offset pages with a fused total for 'alpha', keyset with a
+        limit+1 probe and no count for 'recent'.
+
+        Args:
+            db (Session): Database session.
+            page (int): Page number (1-indexed); used by the 'alpha' sort.
+            per_page (int): Entries per page.
+            sort (str): Sorting method - 'recent' (default) or 'alpha'.
+            before (Optional[int]): Keyset cursor for the 'recent' sort.
+            tag (Optional[str]): Filter by tag name.
+
+        Returns:
+            Tuple[List[dict], Optional[int], Optional[int]]: Card dicts
+            (tags as [{"name": ...}]), total match count (None on the
+            keyset path), and the next (older) keyset cursor or None.
+        """
+        stmt = (
+            select(
+                Entry.id, Entry.title, Entry.url, Entry.notes,
+                func.group_concat(Tag.name).label("tag_csv"),
+            )
+            .outerjoin(entry_tags, entry_tags.c.entry_id == Entry.id)
+            .outerjoin(Tag, Tag.id == entry_tags.c.tag_id)
+            .where(Entry.is_public_copy == True, Entry.is_deleted == False)
+            .group_by(Entry.id)
+        )
+        if tag:
+            # Filter via a semi-join so the group_concat join still sees
+            # every tag on the matching entries, not just the filtered one.
+            stmt = stmt.where(
+                Entry.id.in_(
+                    select(entry_tags.c.entry_id)
+                    .join(Tag, Tag.id == entry_tags.c.tag_id)
+                    .where(Tag.name == tag)
+                )
+            )
+
+        if sort == "alpha":
+            rows = db.execute(
+                stmt.add_columns(func.count().over().label("total"))
+                .order_by(Entry.title.asc())
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            ).all()
+            total = rows[0].total if rows else 0
+            return [SharedEntryService._card(row) for row in rows], total, None
+
+        if before is not None:
+            stmt = stmt.where(Entry.id < before)
+        rows = db.execute(
+            stmt.order_by(Entry.id.desc()).limit(per_page + 1)
+        ).all()
+        cards = [SharedEntryService._card(row) for row in rows[:per_page]]
+        next_before = cards[-1]["id"] if len(rows) > per_page else None
+        return cards, None, next_before
+
+    @staticmethod
+    def _card(row) -> dict:
+        # Tag names can't contain commas (tag input is comma-split), so the
+        # group_concat round-trip is lossless.
+        return {
+            "id": row.id,
+            "title": row.title,
+            "url": row.url,
+            "notes": row.notes,
+            "tags": [{"name": name} for name in row.tag_csv.split(",")] if row.tag_csv else [],
+        }
+
     @staticmethod
     def restore_entry(db: Session, entry_id: int) -> None:
         """
@@ -173,8 +322,9 @@ class EntryQueryService:
         query: Optional[str] = None,
         page: int = 1,
         per_page: int = 10,
-        sort: str = "recent"
-    ) -> Tuple[List[Entry], int]:
+        sort: str = "recent",
+        before: Optional[int] = None,
+    ) -> Tuple[List[Entry], int, Optional[int]]:
         """
         Retrieve entries based on various filter options.
 
@@ -183,13 +333,19 @@ class EntryQueryService:
             user_id (Optional[int]): Restrict results to entries owned by this user.
             public_only (bool): If True, restrict to admin-approved public entries.
             tag (Optional[str]): Filter by tag name.
-            query (Optional[str]): Perform LIKE-based full-text match.
-            page (int): Page number (1-indexed).
+            query (Optional[str]): Perform full-text match via FTS5 (LIKE fallback).
+            page (int): Page number (1-indexed); used by the 'alpha' sort.
             per_page (int): Entries per page.
             sort (str): Sorting method - 'recent' (default) or 'alpha'.
+            before (Optional[int]): Keyset cursor for the 'recent' sort; only
+                entries with a smaller id are returned.
 
         Returns:
-            Tuple[List[Entry], int]: List of entries and total count.
+            Tuple[List[Entry], Optional[int], Optional[int]]: List of
+            entries, total count (None on the keyset-paginated 'recent'
+            sort, which skips the count), and the cursor for the next
+            (older) page - None on the last page or for offset-paginated
+            sorts.
         """
         base = db.query(Entry)
         ef = cls(db, base)._filter_deleted(False)
@@ -202,11 +358,9 @@ class EntryQueryService:
         if tag:
             ef = ef._filter_by_tag(tag)
         if query:
-            ef = ef._full_text_search_like(query)
+            ef = ef._full_text_search(query)
 
-        entries = ef._paginate(page, per_page, sort)._all()
-        total = ef._count()
-        return entries, total
+        return ef._page_with_total(page, per_page, sort, before)
 
     def _filter_by_user(self, user_id):
         self.query = self.query.filter(Entry.user_id == user_id, Entry.is_public_copy == False)
@@ -217,33 +371,72 @@ class EntryQueryService:
         return self
 
     def _filter_by_tag(self, tag):
-        self.query = self.query.filter(Entry.tags.any(Tag.name == tag))
+        # Explicit join instead of .any() so SQLite probes the tag index first
+        # rather than running a correlated EXISTS per entry row.
+        self.query = self.query.join(Entry.tags).filter(Tag.name == tag).distinct()
         return self
 
-    def _full_text_search_like(self, query):
-        pattern = f"%{query}%"
-        self.query = self.query.filter(
-            or_(
-                Entry.title.ilike(pattern),
-                Entry.notes.ilike(pattern),
-                Entry.url.ilike(pattern),
+    def _full_text_search(self, query):
+        if fts_enabled(self.db):
+            fts_ids = _FTS_ID_SQL.bindparams(fts_query=fts_match_query(query))
+            self.query = self.query.filter(Entry.id.in_(fts_ids))
+        else:
+            pattern = f"%{query}%"
+            self.query = self.query.filter(
+                or_(
+                    Entry.title.ilike(pattern),
+                    Entry.notes.ilike(pattern),
+                    Entry.url.ilike(pattern),
+                )
             )
-        )
         return self
 
-    def _paginate(self, page: int, per_page: int, sort: str = "recent"):
-        if sort == "alpha":
-            self.query = self.query.order_by(Entry.title.asc())
-        else:
-            self.query = self.query.order_by(Entry.id.desc())
-        self.query = self.query.offset((page - 1) * per_page).limit(per_page)
-        return self
+    def _page_with_total(
+        self, page: int, per_page: int, sort: str = "recent",
+        before: Optional[int] = None,
+    ):
+        """
+        Fetch one page of entries, with a match total only where needed.
+
+        The 'alpha' sort renders numbered pages, so COUNT(*) OVER () rides
+        along on the page query and the page and total arrive in a single
+        round-trip. The id-ordered 'recent' sort paginates by keyset
+        (`id < before`) and derives has-next from a limit+1 probe, so it
+        skips the count entirely - a window count still scans the whole
+        filtered set even with a LIMIT - and reports the total as None.
 
-    def _all(self):
-        return self.query.all()
+        Args:
+            page (int): Page number (1-indexed); used by the 'alpha' sort.
+            per_page (int): Entries per page.
+            sort (str): Sorting method - 'recent' (default) or 'alpha'.
+            before (Optional[int]): Keyset cursor for the 'recent' sort.
 
-    def _count(self):
-        return self.query.count()
+        Returns:
+            Tuple[List[Entry], Optional[int], Optional[int]]: Page of
+            entries, total match count (None on the keyset path), and the
+            next (older) keyset cursor or None.
+        """
+        paged = self.query.options(selectinload(Entry.tags))
+
+        if sort == "alpha":
+            rows = (
+                paged.add_columns(func.count().over().label("total"))
+                .order_by(Entry.title.asc())
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+                .all()
+            )
+            entries = [row[0] for row in rows]
+            total = rows[0].total if rows else 0
+            return entries, total, None
+
+        if before is not None:
+            paged = paged.filter(Entry.id < before)
+        # Fetch one extra row to learn whether an older page exists.
+        rows = paged.order_by(Entry.id.desc()).limit(per_page + 1).all()
+        entries = rows[:per_page]
+        next_before = entries[-1].id if len(rows) > per_page else None
+        return entries, None, next_before
 
     def _filter_deleted(self, is_deleted: bool = False):
         self.query = self.query.filter(Entry.is_deleted == is_deleted)
@@ -0,0 +1,41 @@
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from server.services.user import UserEntryService
+from server.utils.cache import TTLCache
+
+# A user's distinct tag list only changes when that user mutates entries,
+# but the rolodex re-ran the JOIN+DISTINCT query on every page load. The
+# list is held per user for a short window and dropped eagerly by the
+# entry-mutating endpoints, so stale reads are bounded by the TTL even if
+# an invalidation path is missed.
+_tag_cache = TTLCache(maxsize=10000, ttl=60)
+
+
+def get_user_tags_cached(db: Session, user_id: int) -> List[str]:
+    """
+    Return the user's distinct tag names, served from cache when fresh.
+
+    Args:
+        db (Session): Database session for the fallback query.
+        user_id (int): ID of the user.
+
+    Returns:
+        List[str]: Distinct tag names on the user's active entries.
+    """
+    tags = _tag_cache.get(user_id)
+    if tags is None:
+        tags = UserEntryService.get_user_tags(db, user_id)
+        _tag_cache.set(user_id, tags)
+    return tags
+
+
+def invalidate_user_tags(user_id: int) -> None:
+    """
+    Drop the cached tag list after an entry mutation for the user.
+
+    Args:
+        user_id (int): ID of the user whose entries changed.
+    """
+    _tag_cache.delete(user_id)
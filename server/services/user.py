@@ -3,11 +3,28 @@ from typing import List, Tuple
 
 from fastapi import HTTPException
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from server.models.entities import Entry, Tag
 from server.models.schemas import EntryCreate
-from server.services.shared import SharedEntryService, TagService
+from server.services.shared import SharedEntryService, TagService, fts_match_query
+
+# Built once at import so per-request work is just parameter binding and the
+# sqlite3 driver's statement cache can reuse the prepared plan.
+# COUNT(*) OVER () streams the total alongside the page ids, so the FTS
+# join plan runs once instead of once for rows and once for count.
+_USER_FTS_SQL = text("""
+    SELECT e.id, COUNT(*) OVER () AS total
+    FROM (
+        SELECT rowid
+        FROM entry_fts
+        WHERE entry_fts MATCH :query
+    ) fts
+    JOIN entries e ON e.id = fts.rowid
+    WHERE e.user_id = :user_id AND e.is_deleted = 0
+    ORDER BY e.id DESC
+    LIMIT :limit OFFSET :offset
+""")
 
 
 class UserEntryService:
@@ -69,8 +86,9 @@ class UserEntryService:
         entry.title = data.title
         entry.notes = data.notes
         entry.tags = TagService.resolve_tags(db, data.tags or [])
+        # No refresh: the caller redirects straight to /rolodex, so the
+        # post-commit re-SELECT was a wasted round-trip.
         db.commit()
-        db.refresh(entry)
         return entry
 
     @staticmethod
@@ -136,30 +154,23 @@ class UserEntryService:
         Returns:
             Tuple[List[Entry], int]: Search result entries and total count.
         """
-        sql = text("""
-            SELECT e.id
-            FROM (
-                SELECT rowid
-                FROM entry_fts
-                WHERE entry_fts MATCH :query
-            ) fts
-            JOIN entries e ON e.id = fts.rowid
-            WHERE e.user_id = :user_id AND e.is_deleted = 0
-            ORDER BY e.id DESC
-            LIMIT :limit OFFSET :offset
-        """)
-        id_rows = db.execute(sql, {
+        id_rows = db.execute(_USER_FTS_SQL, {
             "user_id": user_id,
-            "query": query,
+            "query": fts_match_query(query),
             "limit": limit,
             "offset": offset
         }).fetchall()
 
-        ids = [row[0] for row in id_rows]
-        if not ids:
+        if not id_rows:
             return [], 0
+        ids = [row.id for row in id_rows]
+        total = id_rows[0].total
 
-        entries_query = db.query(Entry).filter(Entry.id.in_(ids))
+        # The result cards render entry.tags; selectinload batches the tag
+        # fetch into one IN query instead of one lazy SELECT per entry.
+        entries_query = (
+            db.query(Entry).options(selectinload(Entry.tags)).filter(Entry.id.in_(ids))
+        )
         if sort == "alpha":
             entries_query = entries_query.order_by(Entry.title.asc())
         else:
@@ -167,21 +178,6 @@ class UserEntryService:
 
         entries = entries_query.all()
 
-        count_sql = text("""
-            SELECT COUNT(*)
-            FROM (
-                SELECT rowid
-                FROM entry_fts
-                WHERE entry_fts MATCH :query
-            ) fts
-            JOIN entries e ON e.id = fts.rowid
-            WHERE e.user_id = :user_id AND e.is_deleted = 0
-        """)
-        total = db.execute(count_sql, {
-            "user_id": user_id,
-            "query": query
-        }).scalar()
-
         return entries, total
     
     @staticmethod
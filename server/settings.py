@@ -12,6 +12,8 @@ class Settings(BaseSettings):
         SECRET_KEY (str): Secret key used to sign JWTs. Hardcoded fallback is used for testing; override via .env.
         ALGORITHM (str): JWT signing algorithm (default: HS256).
         ACCESS_TOKEN_EXPIRE_MINUTES (int): Lifetime of access tokens in minutes (default: 1 week).
+        AUTH_CACHE_SIZE (int): Maximum entries in the decoded-token claims cache.
+        AUTH_CACHE_TTL (int): Seconds a verified token's claims are cached.
 
     Notes:
         Use a secure SECRET_KEY in production by setting it in the .env file.
@@ -25,6 +27,8 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 1 week
     MAX_PAGE_SIZE: int = 50
+    AUTH_CACHE_SIZE: int = 10000
+    AUTH_CACHE_TTL: int = 5  # seconds; bounds how long a revoked token verifies
 
     model_config = SettingsConfigDict(
         env_file=".env",
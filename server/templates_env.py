@@ -0,0 +1,26 @@
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from server.settings import settings
+
+# Single environment shared by every view module: each template is compiled
+# once and cached without bound. Source files are only re-stat'd in debug.
+# The bytecode cache persists compiled templates to the system temp dir, so
+# a restarted worker skips the lex/parse step even on its first render.
+templates = Jinja2Templates(
+    directory="server/templates",
+    auto_reload=settings.DEBUG,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+
+def prime_templates(*names: str) -> None:
+    """
+    Force-compile templates so the first request doesn't pay lex/parse cost.
+
+    Args:
+        *names: Template filenames relative to the template directory.
+    """
+    for name in names:
+        templates.get_template(name)
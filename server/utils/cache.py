@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Small thread-safe TTL cache with LRU eviction.
+
+    Entries expire after the configured time-to-live and the least recently
+    used entry is dropped once the cache is full. Intended for in-process
+    caching of cheap-to-rebuild values on hot paths (decoded token claims,
+    rendered fragments), where a short TTL bounds staleness.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept.
+            ttl (float): Default entry lifetime in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for `key`, or None if absent or expired.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Optional[Any]: Cached value, or None on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at < now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store `value` under `key`, evicting the oldest entry when full.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+            ttl (Optional[float]): Lifetime override in seconds; the cache
+                default applies when omitted.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Drop `key` from the cache if present.
+
+        Args:
+            key (Hashable): Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
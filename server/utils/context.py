@@ -1,3 +1,32 @@
+from server.utils.pagination import Pagination, cursor_url
+
+
+def build_keyset_context(path, before, next_before, **params) -> dict:
+    """
+    Construct keyset-pagination context for template rendering.
+
+    Emits the cursor links ("newest" resets the cursor, "older" advances it)
+    with active filters preserved; the keyset flag tells templates to render
+    cursor navigation instead of numbered pages.
+
+    Args:
+        path (str): Base path of the paginated view.
+        before: Current keyset cursor (or None on the first page).
+        next_before: Cursor for the next (older) page (or None on the last).
+        **params: Filter params (tag, q, sort, ...) carried into the links.
+
+    Returns:
+        dict: Dictionary containing keyset navigation context.
+    """
+    return {
+        "keyset": True,
+        "before": before,
+        "next_before": next_before,
+        "newest_url": cursor_url(path, **params) if before else None,
+        "older_url": cursor_url(path, next_before, **params) if next_before else None,
+    }
+
+
 def build_pagination_context(page: int, limit: int, total: int) -> dict:
     """
     Construct pagination metadata for template rendering.
@@ -12,18 +41,26 @@ def build_pagination_context(page: int, limit: int, total: int) -> dict:
     Returns:
         dict: Dictionary containing pagination context.
     """
-    total_pages = (total + limit - 1) // limit
+    return Pagination.from_total(page, limit, total).as_context()
+
+
+def _build_nav_context(path, page, limit, total, tag, query, sort, before, next_before):
+    # The id-ordered 'recent' sort navigates by keyset cursor; 'alpha' and
+    # FTS search results keep numbered offset pages. The keyset path has no
+    # total (the count query is skipped), so no page math is done for it.
+    if query or sort == "alpha":
+        nav = build_pagination_context(page, limit, total)
+        nav["keyset"] = False
+        return nav
     return {
-        "page": page,
         "limit": limit,
         "total": total,
-        "total_pages": total_pages,
-        "has_prev": page > 1,
-        "has_next": (page * limit) < total,
+        **build_keyset_context(path, before, next_before, tag=tag, q=query, sort=sort),
     }
 
 
-def build_yellowpages_context(user, entries, page, limit, total, tag, query, sort):
+def build_yellowpages_context(user, entries, page, limit, total, tag, query, sort,
+                              before=None, next_before=None):
     """
     Build template context for the public Yellow Pages view.
 
@@ -38,6 +75,8 @@ def build_yellowpages_context(user, entries, page, limit, total, tag, query, sor
         tag (str): Tag filter string (or None).
         query (str): Search query string (or None).
         sort (str): Sorting mode, e.g., "newest" or "alpha".
+        before (Optional[int]): Current keyset cursor for the recent sort.
+        next_before (Optional[int]): Cursor for the next (older) page.
 
     Returns:
         dict: Render context dictionary for yellowpages.html.
@@ -50,10 +89,11 @@ def build_yellowpages_context(user, entries, page, limit, total, tag, query, sor
         "action": "/",
         "tag_field": bool(tag),
         "sort": sort,
-        **build_pagination_context(page, limit, total)
+        **_build_nav_context("/", page, limit, total, tag, query, sort, before, next_before)
     }
 
-def build_rolodex_context(request, user, entries, page, limit, total, tag, query, all_tags, sort):
+def build_rolodex_context(request, user, entries, page, limit, total, tag, query, all_tags, sort,
+                          before=None, next_before=None):
     """
     Build template context for a user's private Rolodex dashboard.
 
@@ -70,6 +110,8 @@ def build_rolodex_context(request, user, entries, page, limit, total, tag, query
         query (str): Search query (if any).
         all_tags (List[str]): List of all user tag strings.
         sort (str): Sorting mode, e.g., "newest" or "alpha".
+        before (Optional[int]): Current keyset cursor for the recent sort.
+        next_before (Optional[int]): Cursor for the next (older) page.
 
     Returns:
         dict: Render context for rolodex.html.
@@ -84,37 +126,26 @@ def build_rolodex_context(request, user, entries, page, limit, total, tag, query
         "action": "/rolodex",
         "tag_field": bool(tag),
         "sort": sort,
-        **build_pagination_context(page, limit, total)
+        **_build_nav_context("/rolodex", page, limit, total, tag, query, sort, before, next_before)
     }
 
 
 
-def build_admin_panel_context(
-    request,
-    user,
-    pending_entries, total_pending, page_pending,
-    public_entries, total_public, page_public,
-    deleted_entries, total_deleted, page_deleted,
-    limit
-):
+def build_admin_panel_context(request, user, active_tab, entries, total, before, next_before):
     """
-    Build context for the admin panel with tabbed moderation sections.
+    Build context for the admin panel rendering a single active tab.
 
-    Organizes paginated entries for pending, public, and deleted categories.
+    Only the active tab's keyset-paginated page is fetched and rendered;
+    the other tabs are fetched lazily from /admin/tab/{tab} on switch.
 
     Args:
         request: FastAPI request object.
         user: Authenticated admin user.
-        pending_entries: Entries awaiting review.
-        total_pending (int): Count of pending entries.
-        page_pending (int): Current page in pending tab.
-        public_entries: Admin-managed public entries.
-        total_public (int): Count of public entries.
-        page_public (int): Current page in public tab.
-        deleted_entries: Soft-deleted public entries.
-        total_deleted (int): Count of deleted entries.
-        page_deleted (int): Current page in deleted tab.
-        limit (int): Entries per page across all tabs.
+        active_tab (str): Tab rendered server-side ("pending", "public", "deleted").
+        entries: Page of entries for the active tab.
+        total (int): Total entry count for the active tab from the cursor onward.
+        before (Optional[int]): Current keyset cursor for the active tab.
+        next_before (Optional[int]): Cursor for the next (older) page.
 
     Returns:
         dict: Render context for admin_panel.html.
@@ -122,13 +153,10 @@ def build_admin_panel_context(
     return {
         "request": request,
         "user": user,
-        "pending_entries": pending_entries,
-        "public_entries": public_entries,
-        "deleted_entries": deleted_entries,
-        "page_pending": page_pending,
-        "total_pages_pending": (total_pending + limit - 1) // limit,
-        "page_public": page_public,
-        "total_pages_public": (total_public + limit - 1) // limit,
-        "page_deleted": page_deleted,
-        "total_pages_deleted": (total_deleted + limit - 1) // limit,
+        "active_tab": active_tab,
+        "tab": active_tab,
+        "entries": entries,
+        "total": total,
+        "before": before,
+        "next_before": next_before,
     }
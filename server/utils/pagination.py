@@ -1,5 +1,86 @@
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlencode
+
 from server.settings import settings
 
+
+@dataclass(slots=True)
+class Pagination:
+    """
+    Numbered-pagination state computed once per request.
+
+    Centralizes the total-pages/navigation arithmetic that the views and
+    context builders each used to redo inline.
+    """
+
+    page: int
+    limit: int
+    total: int
+    total_pages: int
+    has_prev: bool
+    has_next: bool
+
+    @classmethod
+    def from_total(cls, page: int, limit: int, total: int) -> "Pagination":
+        """
+        Derive the page count and navigation flags from a result total.
+
+        Args:
+            page (int): Current page number (1-based).
+            limit (int): Number of items per page.
+            total (int): Total number of items.
+
+        Returns:
+            Pagination: Computed pagination state.
+        """
+        # Ceiling division without a modulo or branch; has_next then reuses
+        # the page count instead of re-multiplying page * limit.
+        total_pages = -(-total // limit)
+        return cls(
+            page=page,
+            limit=limit,
+            total=total,
+            total_pages=total_pages,
+            has_prev=page > 1,
+            has_next=page < total_pages,
+        )
+
+    def as_context(self) -> dict:
+        """
+        Flatten the state into the template keys the partials consume.
+
+        Returns:
+            dict: page/limit/total/total_pages/has_prev/has_next mapping.
+        """
+        return {
+            "page": self.page,
+            "limit": self.limit,
+            "total": self.total,
+            "total_pages": self.total_pages,
+            "has_prev": self.has_prev,
+            "has_next": self.has_next,
+        }
+
+
+def cursor_url(path: str, before: Optional[int] = None, **params) -> str:
+    """
+    Build a keyset-pagination link, preserving non-empty filter params.
+
+    Args:
+        path (str): Base path of the paginated view (e.g. "/rolodex").
+        before (Optional[int]): Keyset cursor; omitted when None.
+        **params: Filter params (tag, q, sort, ...) kept when truthy.
+
+    Returns:
+        str: URL with the cursor and active filters encoded.
+    """
+    query = {key: value for key, value in params.items() if value}
+    if before is not None:
+        query["before"] = before
+    return f"{path}?{urlencode(query)}" if query else path
+
+
 def offset(page: int, limit: int) -> int:
     """
     Calculate the pagination offset for SQL queries.
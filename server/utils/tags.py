@@ -0,0 +1,19 @@
+import re
+from typing import List
+
+# Splits on commas and swallows surrounding whitespace/empty segments in one
+# pass, instead of split() followed by a strip() per fragment.
+_TAG_SPLIT = re.compile(r"\s*,\s*")
+
+
+def parse_tag_csv(tags: str) -> List[str]:
+    """
+    Parse a comma-separated tag string into a list of clean tag names.
+
+    Args:
+        tags (str): Raw comma-separated tag input from a form.
+
+    Returns:
+        List[str]: Non-empty tag names with surrounding whitespace removed.
+    """
+    return [tag for tag in _TAG_SPLIT.split(tags.strip()) if tag]
@@ -1,26 +1,98 @@
-from fastapi import APIRouter, HTTPException, Request, Depends, Query
+from functools import partial
+from typing import Optional
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Form, HTTPException, Request, Response, Depends, Query
 from fastapi.responses import RedirectResponse, HTMLResponse
 from sqlalchemy.orm import Session
-from fastapi.templating import Jinja2Templates
 
 from server.models.entities import Entry, User
 from server.models.schemas import EntryCreate
 from server.services.admin import AdminEntryService
+from server.services.listing_cache import invalidate_listings
 from server.services.shared import SharedEntryService
 from server.security import get_db, require_admin
+from server.templates_env import templates
 from server.utils.context import build_admin_panel_context
-from server.utils.pagination import offset
+from server.utils.tags import parse_tag_csv
+
+# The admin gate runs once at the router level; FastAPI's dependency cache
+# reuses the resolved user for handlers that still declare it in their
+# signature, so the token decode and user lookup happen once per request.
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+# Soft-state transitions dispatched by the generic action endpoint. Bound at
+# import time so dispatch is one dict lookup instead of five route matches.
+ACTIONS = {
+    "approve": lambda db, entry_id, user: AdminEntryService.approve_entry(db, entry_id, user),
+    "reject": lambda db, entry_id, user: AdminEntryService.reject_entry(db, entry_id),
+    "delete": lambda db, entry_id, user: AdminEntryService.delete_entry(db, entry_id),
+    "restore": lambda db, entry_id, user: SharedEntryService.restore_entry(db, entry_id),
+    "purge": lambda db, entry_id, user: AdminEntryService.purge_entry(db, entry_id),
+}
+
+# Tab to fall back to when the posting form didn't carry one.
+DEFAULT_TAB = {
+    "approve": "pending",
+    "reject": "pending",
+    "delete": "public",
+    "restore": "deleted",
+    "purge": "deleted",
+}
+
+# Per-tab page loader and empty-state copy for the dashboard fragments.
+TABS = {
+    "pending": (AdminEntryService.get_pending_submissions, "No entries pending review."),
+    "public": (AdminEntryService.get_public_entries, "No public entries."),
+    "deleted": (AdminEntryService.get_deleted_entries, "No deleted entries."),
+}
+
+
+# URL templates and response constructor prebuilt at import so each redirect
+# costs one format_map plus one allocation. 303 turns the POST into a GET on
+# the redirected request, and a bare Response skips RedirectResponse's URL
+# quoting pass.
+_REDIRECT_URL = "/admin?{query}#tab-{tab}"
+_redirect_response = partial(Response, status_code=303)
+
+
+def _redirect(url: str) -> Response:
+    """
+    Build a body-less 303 See Other response pointing at `url`.
+
+    Args:
+        url (str): Redirect target.
+
+    Returns:
+        Response: Empty response with a location header.
+    """
+    return _redirect_response(headers={"location": url})
+
+
+def _admin_redirect(active_tab: str, **cursors) -> Response:
+    """
+    Build a redirect back to the admin panel, keeping non-empty tab cursors.
+
+    Args:
+        active_tab (str): Tab to re-activate via the URL fragment.
+        **cursors: before_* cursor values; empty values are dropped.
 
-templates = Jinja2Templates(directory="server/templates")
-router = APIRouter()
+    Returns:
+        Response: 303 redirect to the admin panel with tab context.
+    """
+    params = {"active_tab": active_tab}
+    params.update((key, value) for key, value in cursors.items() if value)
+    url = _REDIRECT_URL.format_map({"query": urlencode(params), "tab": active_tab})
+    return _redirect(url)
 
 
 @router.get("/admin", response_class=HTMLResponse)
 def admin_panel(
     request: Request,
-    page_pending: int = Query(1, ge=1),
-    page_public: int = Query(1, ge=1),
-    page_deleted: int = Query(1, ge=1),
+    active_tab: str = Query("pending"),
+    before_pending: Optional[int] = Query(None, ge=1),
+    before_public: Optional[int] = Query(None, ge=1),
+    before_deleted: Optional[int] = Query(None, ge=1),
     limit: int = 10,
     user: User = Depends(require_admin),
     db: Session = Depends(get_db),
@@ -28,112 +100,88 @@ def admin_panel(
     """
     Render the admin moderation dashboard.
 
-    Displays three paginated tabs: pending submissions, public entries, and deleted items.
-    Only accessible to users with admin privileges.
+    Only the active tab's keyset-paginated page is queried and rendered
+    server-side; the other two tabs load lazily from /admin/tab/{tab} on
+    first switch, so a plain dashboard hit costs one list query.
 
     Args:
         request (Request): Incoming HTTP request.
-        page_pending (int): Page index for pending submissions tab.
-        page_public (int): Page index for public entries tab.
-        page_deleted (int): Page index for deleted entries tab.
+        active_tab (str): Tab to render ("pending", "public", "deleted").
+        before_pending (Optional[int]): Keyset cursor for the pending tab.
+        before_public (Optional[int]): Keyset cursor for the public tab.
+        before_deleted (Optional[int]): Keyset cursor for the deleted tab.
         limit (int): Number of entries per page.
         user (User): Authenticated admin user.
         db (Session): Database session.
 
     Returns:
-        HTMLResponse: Rendered admin panel with tabbed entry lists.
+        HTMLResponse: Rendered admin panel with the active tab populated.
     """
-    offset_pending = offset(page_pending, limit)
-    offset_public = offset(page_public, limit)
-    offset_deleted = offset(page_deleted, limit)
-
-    pending_entries, total_pending = AdminEntryService.get_pending_submissions(db, limit=limit, offset=offset_pending)
-    public_entries, total_public = AdminEntryService.get_public_entries(db, limit=limit, offset=offset_public)
-    deleted_entries, total_deleted = AdminEntryService.get_deleted_entries(db, limit=limit, offset=offset_deleted)
-
-    return templates.TemplateResponse(
-        "admin_panel.html",
-        build_admin_panel_context(
-            request=request,
-            user=user,
-            pending_entries=pending_entries,
-            total_pending=total_pending,
-            page_pending=page_pending,
-            public_entries=public_entries,
-            total_public=total_public,
-            page_public=page_public,
-            deleted_entries=deleted_entries,
-            total_deleted=total_deleted,
-            page_deleted=page_deleted,
-            limit=limit,
-        )
+    if active_tab not in TABS:
+        active_tab = "pending"
+    loader, empty_message = TABS[active_tab]
+    before = {
+        "pending": before_pending,
+        "public": before_public,
+        "deleted": before_deleted,
+    }[active_tab]
+    entries, next_before, total = loader(db, limit=limit, before=before)
+
+    context = build_admin_panel_context(
+        request=request,
+        user=user,
+        active_tab=active_tab,
+        entries=entries,
+        total=total,
+        before=before,
+        next_before=next_before,
     )
+    context["empty_message"] = empty_message
+    return templates.TemplateResponse("admin_panel.html", context)
 
 
-
-@router.post("/admin/{entry_id}/approve")
-def approve_entry(
-    entry_id: int,
-    page_pending: int = Query(1),
-    page_public: int = Query(1),
-    active_tab: str = Query("pending"),
+@router.get("/admin/tab/{tab}", response_class=HTMLResponse)
+def admin_tab_fragment(
+    tab: str,
+    request: Request,
+    before: Optional[int] = Query(None, ge=1),
+    limit: int = 10,
     db: Session = Depends(get_db),
-    user: User = Depends(require_admin)
 ):
     """
-    Approve a submitted entry for public listing.
+    Render one dashboard tab as an HTML fragment for lazy loading.
 
-    Forks the user entry into a new admin-managed public entry.
-    Redirects back to the admin panel with tab and pagination preserved.
+    Fetched by the tab-switching script the first time an admin opens a
+    tab that wasn't rendered with the initial page.
 
     Args:
-        entry_id (int): ID of the user-submitted entry.
-        page_pending (int): Current pending page (for redirect).
-        page_public (int): Current public page (for redirect).
-        active_tab (str): Which tab was active before action.
+        tab (str): Tab name ("pending", "public", "deleted").
+        request (Request): Incoming HTTP request.
+        before (Optional[int]): Keyset cursor for the tab.
+        limit (int): Number of entries per page.
         db (Session): Database session.
-        user (User): Authenticated admin user.
 
     Returns:
-        RedirectResponse: Redirect to admin panel with tab context.
-    """
-    AdminEntryService.approve_entry(db, entry_id, user)
-    return RedirectResponse(
-        f"/admin?page_pending={page_pending}&page_public={page_public}#tab-{active_tab}",
-        status_code=302
-    )
-
+        HTMLResponse: Rendered tab fragment.
 
-@router.post("/admin/{entry_id}/reject")
-def reject_entry(
-    entry_id: int,
-    page_pending: int = Query(1),
-    page_public: int = Query(1),
-    active_tab: str = Query("pending"),
-    db: Session = Depends(get_db),
-    user: User = Depends(require_admin)
-):
+    Raises:
+        HTTPException: If the tab name is unknown.
     """
-    Reject a submitted entry, marking it as reviewed but not published.
-
-    Removes it from the pending list without creating a public copy.
+    if tab not in TABS:
+        raise HTTPException(status_code=404, detail="Unknown admin tab")
+    loader, empty_message = TABS[tab]
+    entries, next_before, total = loader(db, limit=limit, before=before)
 
-    Args:
-        entry_id (int): ID of the entry to reject.
-        page_pending (int): Current pending page (for redirect).
-        page_public (int): Current public page (for redirect).
-        active_tab (str): Which tab was active before action.
-        db (Session): Database session.
-        user (User): Authenticated admin user.
+    return templates.TemplateResponse("partials/_admin_tab.html", {
+        "request": request,
+        "tab": tab,
+        "entries": entries,
+        "total": total,
+        "before": before,
+        "next_before": next_before,
+        "empty_message": empty_message,
+    })
 
-    Returns:
-        RedirectResponse: Redirect to admin panel with tab context.
-    """
-    AdminEntryService.reject_entry(db, entry_id)
-    return RedirectResponse(
-        f"/admin?page_pending={page_pending}&page_public={page_public}#tab-{active_tab}",
-        status_code=302
-    )
 
 
 @router.get("/admin/{entry_id}/edit", response_class=HTMLResponse)
@@ -164,12 +212,14 @@ def edit_admin_entry_form(
     })
 
 
-@router.post("/admin/{entry_id}/edit")
-async def update_admin_entry(
+@router.post("/admin/{entry_id}/edit", response_class=RedirectResponse)
+def update_admin_entry(
     entry_id: int,
-    request: Request,
+    title: str = Form(""),
+    url: str = Form(""),
+    notes: str = Form(""),
+    tags: str = Form(""),
     db: Session = Depends(get_db),
-    user: User = Depends(require_admin)
 ):
     """
     Process updates to an existing public entry.
@@ -178,21 +228,23 @@ async def update_admin_entry(
 
     Args:
         entry_id (int): ID of the entry to update.
-        request (Request): Incoming form data request.
+        title (str): Updated entry title.
+        url (str): Updated entry URL.
+        notes (str): Updated entry notes.
+        tags (str): Comma-separated tag names.
         db (Session): Database session.
-        user (User): Authenticated admin user.
 
     Returns:
-        RedirectResponse: Redirect to public entries tab.
+        Response: 303 redirect to the public entries tab.
     """
-    form_data = await request.form()
-    title = form_data.get("title", "").strip()
-    url = form_data.get("url", "").strip()
-    notes = form_data.get("notes", "").strip()
-    tags_raw = form_data.get("tags", "")
-    tag_list = [tag.strip() for tag in tags_raw.split(",") if tag.strip()]
-
-    entry_data = EntryCreate(
+    title = title.strip()
+    url = url.strip()
+    notes = notes.strip()
+    tag_list = parse_tag_csv(tags)
+
+    # model_construct skips validation; the fields were already normalized
+    # above and the service just copies them onto the entity.
+    entry_data = EntryCreate.model_construct(
         title=title,
         url=url,
         notes=notes,
@@ -200,110 +252,52 @@ async def update_admin_entry(
     )
 
     AdminEntryService.update_entry(db, entry_id, entry_data)
+    invalidate_listings()
 
-    return RedirectResponse("/admin#tab-public", status_code=302)
-
-
-@router.post("/admin/{entry_id}/delete")
-async def delete_admin_entry(
-    entry_id: int,
-    request: Request,
-    db: Session = Depends(get_db),
-    user: User = Depends(require_admin)
-):
-
-    """
-    Soft-delete a public entry from the Yellow Pages.
-
-    Removes it from public listing but retains it in the deleted tab for possible restoration.
-
-    Args:
-        entry_id (int): ID of the public entry to delete.
-        request (Request): Incoming form data.
-        db (Session): Database session.
-        user (User): Authenticated admin user.
-
-    Returns:
-        RedirectResponse: Redirect to admin panel with tab context.
-    """
-    form_data = await request.form()
-    page_pending = form_data.get("page_pending", "1")
-    page_public = form_data.get("page_public", "1")
-    active_tab = form_data.get("active_tab", "pending")
-
-    AdminEntryService.delete_entry(db, entry_id)
-
-    redirect_url = f"/admin?page_pending={page_pending}&page_public={page_public}#tab-{active_tab}"
-    return RedirectResponse(redirect_url, status_code=302)
-
+    return _redirect("/admin?active_tab=public#tab-public")
 
-@router.post("/admin/{entry_id}/restore")
-async def restore_admin_entry(
-    entry_id: int,
-    request: Request,
-    db: Session = Depends(get_db),
-    user: User = Depends(require_admin)
-):
-    """
-    Restore a previously deleted public entry.
-
-    Makes the entry visible again in the public Yellow Pages tab.
-
-    Args:
-        entry_id (int): ID of the entry to restore.
-        request (Request): Incoming form data.
-        db (Session): Database session.
-        user (User): Authenticated admin user.
 
-    Returns:
-        RedirectResponse: Redirect to admin panel with tab context.
-    """
-    form_data = await request.form()
-    page_deleted = form_data.get("page_deleted", "1")
-    page_pending = form_data.get("page_pending", "1")
-    page_public = form_data.get("page_public", "1")
-    active_tab = form_data.get("active_tab", "deleted")
-
-    SharedEntryService.restore_entry(db, entry_id)
-
-    redirect_url = (
-        f"/admin?page_pending={page_pending}&page_public={page_public}"
-        f"&page_deleted={page_deleted}#tab-{active_tab}"
-    )
-    return RedirectResponse(redirect_url, status_code=302)
-
-
-@router.post("/admin/{entry_id}/purge")
-async def purge_admin_entry(
+@router.post("/admin/{entry_id}/{action}", response_class=RedirectResponse)
+def admin_entry_action(
     entry_id: int,
-    request: Request,
+    action: str,
+    active_tab: str = Form(""),
+    before_pending: str = Form(""),
+    before_public: str = Form(""),
+    before_deleted: str = Form(""),
     db: Session = Depends(get_db),
     user: User = Depends(require_admin)
 ):
     """
-    Permanently purge a deleted entry from the system.
+    Apply a moderation state transition to an entry.
 
-    Irreversibly removes admin-managed entry from the database.
+    Dispatches approve, reject, delete, restore, and purge through a single
+    route; the concrete service call is looked up in the ACTIONS table.
+    Redirects back to the admin panel with tab and cursor state preserved.
 
     Args:
-        entry_id (int): ID of the deleted entry to purge.
-        request (Request): Incoming form data.
+        entry_id (int): ID of the entry to act on.
+        action (str): One of the keys in ACTIONS.
+        active_tab (str): Tab the action was posted from.
+        before_pending (str): Keyset cursor for the pending tab.
+        before_public (str): Keyset cursor for the public tab.
+        before_deleted (str): Keyset cursor for the deleted tab.
         db (Session): Database session.
         user (User): Authenticated admin user.
 
     Returns:
-        RedirectResponse: Redirect to admin panel with tab context.
+        Response: 303 redirect to the admin panel with tab context.
     """
-    form_data = await request.form()
-    page_deleted = form_data.get("page_deleted", "1")
-    page_pending = form_data.get("page_pending", "1")
-    page_public = form_data.get("page_public", "1")
-    active_tab = form_data.get("active_tab", "deleted")
-
-    AdminEntryService.purge_entry(db, entry_id)
-
-    redirect_url = (
-        f"/admin?page_pending={page_pending}&page_public={page_public}"
-        f"&page_deleted={page_deleted}#tab-{active_tab}"
+    handler = ACTIONS.get(action)
+    if handler is None:
+        raise HTTPException(status_code=404, detail="Unknown admin action")
+
+    handler(db, entry_id, user)
+    # Every moderation action can change what the public listing shows.
+    invalidate_listings()
+    return _admin_redirect(
+        active_tab or DEFAULT_TAB[action],
+        before_pending=before_pending,
+        before_public=before_public,
+        before_deleted=before_deleted,
     )
-    return RedirectResponse(redirect_url, status_code=302)
\ No newline at end of file
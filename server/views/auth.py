@@ -1,18 +1,56 @@
+import hashlib
+from typing import Dict, Tuple
+
 from fastapi import APIRouter, Response, HTTPException, status, Depends, Form
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.requests import Request
-from fastapi.responses import RedirectResponse
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 
 from server.models.entities import User
-from server.security import create_token, get_db
+from server.security import (
+    create_token,
+    dummy_verify,
+    get_db,
+    hash_password,
+    rehash_if_needed,
+    verify_password,
+)
+from server.templates_env import templates
 
 
 router = APIRouter(tags=["auth"])
-templates = Jinja2Templates(directory="server/templates")
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# The login and register pages render identically on every hit, so the bytes
+# are rendered once (lazily, since url_for needs a live request) and replayed
+# with ETag/Cache-Control headers from then on.
+_page_cache: Dict[str, Tuple[str, bytes]] = {}
+_CACHE_CONTROL = "public, max-age=600"
+
+
+def _static_page(request: Request, name: str) -> Response:
+    """
+    Serve a template whose output never varies, from the rendered-bytes cache.
+
+    Args:
+        request (Request): Incoming HTTP request; used for the first render
+            and for the If-None-Match fast path.
+        name (str): Template filename relative to the template directory.
+
+    Returns:
+        Response: Cached HTML body, or an empty 304 on an ETag match.
+    """
+    cached = _page_cache.get(name)
+    if cached is None:
+        body = templates.get_template(name).render({"request": request}).encode()
+        cached = ('"%s"' % hashlib.md5(body).hexdigest(), body)
+        _page_cache[name] = cached
+    etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="text/html", headers=headers)
 
 
 @router.get("/login", response_class=HTMLResponse)
@@ -28,7 +66,11 @@ def login_page(request: Request):
     Returns:
         HTMLResponse: Rendered login form template.
     """
-    return templates.TemplateResponse(request, "login.html", {"request": request})
+    # The hidden "next" input echoes the query string, so only the plain
+    # /login page (no query params) is byte-cacheable.
+    if request.query_params:
+        return templates.TemplateResponse(request, "login.html", {"request": request})
+    return _static_page(request, "login.html")
 
 
 @router.post("/login")
@@ -56,11 +98,29 @@ def login_post(
     Returns:
         RedirectResponse: Redirect to `next` path with token cookie set.
     """
-    user = db.query(User).filter(User.username == username).first()
-    if not user or not pwd_context.verify(password, user.password_hash):
+    user = db.execute(
+        select(User).where(User.username == username)
+    ).scalar_one_or_none()
+    if not user:
+        # Same Argon2 cost as a real check, so unknown usernames aren't
+        # distinguishable from wrong passwords by response timing.
+        dummy_verify(password)
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    if not verify_password(password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = create_token({"sub": user.username})
+    # Transparently migrate hashes made with a deprecated scheme (bcrypt)
+    # to the current one while the plaintext is available.
+    new_hash = rehash_if_needed(password, user.password_hash)
+    if new_hash is not None:
+        user.password_hash = new_hash
+        db.commit()
+
+    # uid/is_admin ride along in the signed payload so render-only pages
+    # can build their user context without a database lookup.
+    token = create_token(
+        {"sub": user.username, "uid": user.id, "is_admin": user.is_admin}
+    )
     resp = RedirectResponse(url=next, status_code=302)
     resp.set_cookie(key="access_token", value=token, httponly=True)
     return resp
@@ -79,7 +139,7 @@ def register_page(request: Request):
     Returns:
         HTMLResponse: Rendered registration page.
     """
-    return templates.TemplateResponse(request, "register.html", {"request": request})
+    return _static_page(request, "register.html")
 
 
 @router.post("/register")
@@ -104,20 +164,34 @@ def register_post(
     Returns:
         RedirectResponse: Redirect to login page after successful registration.
     """
-    existing_user = db.query(User).filter(User.username == username).first()
-    if existing_user:
+    # One round-trip instead of an existence check plus insert: ON CONFLICT
+    # DO NOTHING means a taken username simply returns no id. The unique
+    # index on username also closes the race two concurrent registrations
+    # could win with the old check-then-insert.
+    new_id = db.execute(
+        sqlite_insert(User)
+        .values(username=username, password_hash=hash_password(password))
+        .on_conflict_do_nothing(index_elements=["username"])
+        .returning(User.id)
+    ).scalar()
+    if new_id is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
-
-    hashed_password = pwd_context.hash(password)
-    new_user = User(username=username, password_hash=hashed_password)
-    db.add(new_user)
     db.commit()
     return RedirectResponse(url="/login", status_code=302)
 
 
+# Logout always produces the same response: redirect home, expire the token
+# cookie. Both header values are constants, so they're built once here.
+_LOGOUT_HEADERS = {
+    "location": "/",
+    "set-cookie": 'access_token=""; Path=/; Max-Age=0; HttpOnly; SameSite=lax',
+}
+
+
 @router.get("/logout")
 def logout():
     """
@@ -126,8 +200,6 @@ def logout():
     Clears the `access_token` cookie and redirects to homepage.
 
     Returns:
-        RedirectResponse: Redirect to home with session cleared.
+        Response: Redirect to home with session cleared.
     """
-    response = RedirectResponse(url="/", status_code=302)
-    response.delete_cookie("access_token")
-    return response
\ No newline at end of file
+    return Response(status_code=302, headers=_LOGOUT_HEADERS)
\ No newline at end of file
@@ -1,14 +1,47 @@
-from fastapi import APIRouter, Request, Cookie, Depends
+import gzip
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Request, Cookie, Depends, Response
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from server.models.entities import User
 from server.security import get_db, get_optional_user
+from server.templates_env import templates
 
-templates = Jinja2Templates(directory="server/templates")
 router = APIRouter()
 
+# The about page only varies on the signed-in user (the nav bar), so the
+# anonymous render — the bulk of the traffic — is cached as bytes after the
+# first hit, in plain and gzipped form. Rendered lazily since url_for needs
+# a live request.
+_about_anon: Optional[Tuple[bytes, bytes]] = None
+_ABOUT_HEADERS = {"Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+
+
+def _anon_about(request: Request) -> Response:
+    """
+    Serve the anonymous about page from the rendered-bytes cache.
+
+    Args:
+        request (Request): Incoming HTTP request; used for the first render
+            and for content-encoding negotiation.
+
+    Returns:
+        Response: Cached HTML body, gzipped when the client accepts it.
+    """
+    global _about_anon
+    if _about_anon is None:
+        body = templates.get_template("about.html").render(
+            {"request": request, "user": None}
+        ).encode()
+        _about_anon = (body, gzip.compress(body, compresslevel=6))
+    body, body_gz = _about_anon
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers = dict(_ABOUT_HEADERS, **{"Content-Encoding": "gzip"})
+        return Response(body_gz, media_type="text/html", headers=headers)
+    return Response(body, media_type="text/html", headers=_ABOUT_HEADERS)
+
 
 @router.get("/about", response_class=HTMLResponse)
 def about_page(
@@ -20,7 +53,9 @@ def about_page(
     Render the static About page.
 
     Attempts to identify the user via access token to provide optional context.
-    Used to describe the purpose and scope of the application.
+    Used to describe the purpose and scope of the application. Anonymous
+    visitors get pre-rendered cached bytes; Jinja only runs for signed-in
+    users.
 
     Args:
         request (Request): Incoming HTTP request.
@@ -31,4 +66,6 @@ def about_page(
         HTMLResponse: Rendered about page with optional user context.
     """
     user: User = get_optional_user(access_token, db)
-    return templates.TemplateResponse(request, "about.html", {"request": request, "user": user})
\ No newline at end of file
+    if user is None:
+        return _anon_about(request)
+    return templates.TemplateResponse(request, "about.html", {"request": request, "user": user})
@@ -2,19 +2,20 @@ from typing import Optional
 
 from fastapi import APIRouter, Request, Depends, Form, HTTPException, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from server.security import get_current_user, get_db
 from server.models.entities import User, Entry, Tag
 from server.models.schemas import EntryCreate
+from server.services.tag_cache import get_user_tags_cached, invalidate_user_tags
 from server.services.user import UserEntryService
 from server.services.shared import EntryQueryService, SharedEntryService
+from server.templates_env import templates
 from server.utils.context import build_rolodex_context
+from server.utils.tags import parse_tag_csv
 from server.utils.pagination import offset
 
 
-templates = Jinja2Templates(directory="server/templates")
 router = APIRouter()
 
 
@@ -24,6 +25,7 @@ def rolodex(
     tag: Optional[str] = Query(None),
     q: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
+    before: Optional[int] = Query(None, ge=1),
     limit: int = 10,
     sort: str = Query("alpha", pattern="^(recent|alpha)$"),
     user: User = Depends(get_current_user),
@@ -40,7 +42,8 @@ def rolodex(
         request (Request): HTTP request object for rendering.
         tag (Optional[str]): Filter entries by tag.
         q (Optional[str]): Full-text query string.
-        page (int): Current pagination page (1-indexed).
+        page (int): Current pagination page (1-indexed); used by the alpha sort.
+        before (Optional[int]): Keyset cursor for the recent sort.
         limit (int): Number of entries per page.
         sort (str): Sort order, either "recent" or "alpha".
         user (User): Authenticated user via dependency injection.
@@ -60,18 +63,20 @@ def rolodex(
             offset=offset_value,
             sort=sort
         )
+        next_before = None
     else:
-        entries, total = EntryQueryService.get_entries(
+        entries, total, next_before = EntryQueryService.get_entries(
             db=db,
             user_id=user.id,
             tag=tag,
             query=q,
             page=page,
             per_page=limit,
-            sort=sort
+            sort=sort,
+            before=before,
         )
 
-    all_tags = UserEntryService.get_user_tags(db, user.id)
+    all_tags = get_user_tags_cached(db, user.id)
 
     return templates.TemplateResponse(
         "rolodex.html",
@@ -84,8 +89,10 @@ def rolodex(
             total=total,
             tag=tag,
             query=q,
-            all_tags=[t[0] for t in all_tags],
-            sort=sort
+            all_tags=all_tags,
+            sort=sort,
+            before=before,
+            next_before=next_before,
         )
     )
 
@@ -131,9 +138,10 @@ def create_entry_from_form(
     Returns:
         RedirectResponse: Redirect to Rolodex after creation.
     """
-    tag_list = [t.strip() for t in tags.split(",") if t.strip()]
+    tag_list = parse_tag_csv(tags)
     entry_in = EntryCreate(url=url, title=title, notes=notes, tags=tag_list)
     UserEntryService.create_entry(db, entry_in, user.id)
+    invalidate_user_tags(user.id)
     return RedirectResponse("/rolodex", status_code=303)
 
 
@@ -192,10 +200,11 @@ def edit_entry(
     Returns:
         RedirectResponse: Redirect to Rolodex.
     """
-    tag_list = [t.strip() for t in tags.split(",") if t.strip()]
+    tag_list = parse_tag_csv(tags)
     entry_data = EntryCreate(title=title, url=url, notes=notes, tags=tag_list)
     
     UserEntryService.update_entry(db, entry_id, user.id, entry_data)
+    invalidate_user_tags(user.id)
 
     return RedirectResponse("/rolodex", status_code=302)
 
@@ -220,6 +229,7 @@ def delete_entry(
         RedirectResponse: Redirect to Rolodex or Admin view.
     """
     UserEntryService.soft_delete_entry(db, entry_id, user.id)
+    invalidate_user_tags(user.id)
 
     return RedirectResponse("/rolodex",status_code=302)
 
@@ -1,16 +1,21 @@
-from fastapi import APIRouter, Request, Depends, Query, Cookie
+import hashlib
+
+from fastapi import APIRouter, Request, Depends, Query, Cookie, Response
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from fastapi.templating import Jinja2Templates
-
 from server.security import get_db, get_optional_user
-from server.services.shared import EntryQueryService, SharedEntryService
+from server.services.listing_cache import (
+    get_cached_listing,
+    listing_version,
+    store_listing,
+)
+from server.services.shared import SharedEntryService
+from server.templates_env import templates
 from server.utils.context import build_yellowpages_context
 from server.utils.pagination import offset
 
-templates = Jinja2Templates(directory="server/templates")
 router = APIRouter()
 
 
@@ -20,6 +25,7 @@ def yellowpages(
     q: Optional[str] = Query(None),
     tag: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
+    before: Optional[int] = Query(None, ge=1),
     limit: int = 10,
     sort: str = Query("alpha", pattern="^(recent|alpha)$"),
     access_token: Optional[str] = Cookie(None),
@@ -35,7 +41,8 @@ def yellowpages(
         request (Request): Incoming HTTP request object for template rendering.
         q (Optional[str]): Full-text search query.
         tag (Optional[str]): Tag filter for narrowing results.
-        page (int): Page number for pagination (1-based).
+        page (int): Page number for pagination (1-based); used by the alpha sort.
+        before (Optional[int]): Keyset cursor for the recent sort.
         limit (int): Number of entries per page.
         sort (str): Sort order, either "recent" or "alpha".
         access_token (Optional[str]): JWT token for optional user context.
@@ -45,25 +52,56 @@ def yellowpages(
         HTMLResponse: Rendered Yellow Pages listing with entries and filters applied.
     """
     user = get_optional_user(access_token, db)
+
+    # Anonymous visitors all see the same page for the same parameters, so
+    # the rendered HTML is served from the listing cache when fresh; admin
+    # moderation actions invalidate it. The ETag folds the listing version
+    # in, so a repeat viewer with an unchanged listing gets a body-less 304
+    # before any database or template work.
+    cache_key = None
+    headers = None
+    if user is None:
+        cache_key = (q, tag, page, limit, sort, before)
+        etag = 'W/"%s-%d"' % (
+            hashlib.md5(repr(cache_key).encode()).hexdigest(),
+            listing_version(),
+        )
+        headers = {"ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        cached = get_cached_listing(cache_key)
+        if cached is not None:
+            return HTMLResponse(cached, headers=headers)
+
     offset_value = offset(page, limit)
 
     if q:
         entries, total = SharedEntryService.search_public_entries_fts(
             db, query=q, limit=limit, offset=offset_value, sort=sort
         )
+        next_before = None
     else:
-        entries, total = EntryQueryService.get_entries(
-            db=db,
-            public_only=True,
-            tag=tag,
+        # Card dicts, not Entry instances: the public cards render a fixed
+        # handful of columns, so the listing skips ORM materialization.
+        entries, total, next_before = SharedEntryService.list_public_cards(
+            db,
             page=page,
             per_page=limit,
-            sort=sort
+            sort=sort,
+            before=before,
+            tag=tag,
         )
 
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         request,
         "yellowpages.html",
-        build_yellowpages_context(user, entries, page, limit, total, tag, q, sort)
-    )
\ No newline at end of file
+        build_yellowpages_context(
+            user, entries, page, limit, total, tag, q, sort,
+            before=before, next_before=next_before,
+        ),
+        headers=headers,
+    )
+    if cache_key is not None:
+        store_listing(cache_key, response.body)
+    return response
\ No newline at end of file
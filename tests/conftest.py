@@ -3,10 +3,12 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from server import security
 from server.api.main import app
 from server.models.entities import Base, User
 from server.db.connection import get_db
-from server.security import pwd_context, create_token
+from server.services import listing_cache, tag_cache
+from server.security import hash_password, create_token
 
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
@@ -34,22 +36,37 @@ def db_session(SessionLocal, engine):
     transaction.rollback()
     connection.close()
 
-# --- Override FastAPI's DB dependency ---
+# --- One TestClient per session: app startup (template priming, route
+# --- setup) runs once instead of once per test.
+@pytest.fixture(scope="session")
+def app_client():
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+# --- Override FastAPI's DB dependency per test ---
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(app_client, db_session):
     def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as c:
-        yield c
+    # The client and app outlive the test, but each test gets a fresh DB:
+    # cookies plus cached token->user-id, per-user tag, and rendered-page
+    # entries must not leak from one test's database into the next.
+    app_client.cookies.clear()
+    security._user_id_cache.clear()
+    tag_cache._tag_cache.clear()
+    listing_cache.invalidate_listings()
 
-    app.dependency_overrides.clear()
+    yield app_client
+
+    app.dependency_overrides.pop(get_db, None)
 
 @pytest.fixture
 def test_user(db_session):
-    user = User(username="testuser", password_hash=pwd_context.hash("testpass"))
+    user = User(username="testuser", password_hash=hash_password("testpass"))
     db_session.add(user)
     db_session.commit()
     return user
@@ -60,7 +77,7 @@ def access_token(test_user):
 
 @pytest.fixture
 def admin_token(db_session):
-    admin = User(username="admin", password_hash=pwd_context.hash("adminpass"), is_admin=True)
+    admin = User(username="admin", password_hash=hash_password("adminpass"), is_admin=True)
     db_session.add(admin)
     db_session.commit()
     return create_token({"sub": admin.username})
@@ -70,7 +70,7 @@ def test_edit_admin_copy_persists_changes(client, db_session, admin_token):
         data={"title": "Edited Title", "notes": "Updated", "tags": "edited"},
         follow_redirects=False
     )
-    assert response.status_code == 302
+    assert response.status_code == 303
 
     db_session.refresh(admin_entry)
     assert admin_entry.title == "Edited Title"
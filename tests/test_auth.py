@@ -1,3 +1,8 @@
+import bcrypt
+
+from server.models.entities import User
+
+
 def test_register_new_user(client):
     """Test that a new user can register and is redirected to the login page."""
     response = client.post("/register", data={"username": "newuser", "password": "newpass"}, follow_redirects=False)
@@ -27,6 +32,50 @@ def test_login_invalid_credentials(client):
     assert response.status_code == 401
 
 
+def test_login_migrates_legacy_bcrypt_hash(client, db_session):
+    """Check that logging in against a bcrypt row succeeds and rewrites it to Argon2id."""
+    legacy_hash = bcrypt.hashpw(b"oldpass", bcrypt.gensalt(rounds=4)).decode()
+    user = User(username="legacyuser", password_hash=legacy_hash)
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post("/login", data={"username": "legacyuser", "password": "oldpass"}, follow_redirects=False)
+    assert response.status_code == 302
+    assert "access_token=" in response.headers["set-cookie"]
+
+    db_session.refresh(user)
+    assert user.password_hash.startswith("$argon2")
+
+    # The migrated hash still verifies on the next login.
+    response = client.post("/login", data={"username": "legacyuser", "password": "oldpass"}, follow_redirects=False)
+    assert response.status_code == 302
+
+
+def test_login_wrong_password(client, test_user):
+    """Verify that a wrong password for an existing user returns a 401 without a cookie."""
+    response = client.post("/login", data={"username": "testuser", "password": "notthepass"})
+    assert response.status_code == 401
+    assert "access_token=" not in response.headers.get("set-cookie", "")
+
+
+def test_static_auth_page_etag_revalidation(client):
+    """Ensure the cached register page carries an ETag that revalidates to a 304."""
+    response = client.get("/register")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "Cache-Control" in response.headers
+
+    revalidated = client.get("/register", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    # A repeat unconditional GET replays the same cached bytes and validator.
+    repeat = client.get("/register")
+    assert repeat.status_code == 200
+    assert repeat.headers["etag"] == etag
+    assert repeat.content == response.content
+
+
 def test_logout_clears_cookie(client):
     """Confirm that logging out clears the access token by setting an expired cookie."""
     client.post("/register", data={"username": "byeuser", "password": "bye"})
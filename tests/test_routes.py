@@ -1,3 +1,6 @@
+from server.models.entities import Entry
+
+
 def test_yellowpages_public_view(client):
     """Ensure the yellowpages root URL renders successfully for anonymous users."""
     response = client.get("/")
@@ -6,6 +9,47 @@ def test_yellowpages_public_view(client):
     assert "<title>" in response.text
 
 
+def test_yellowpages_etag_revalidation(client):
+    """Ensure anonymous listing responses carry an ETag that revalidates to a 304."""
+    response = client.get("/")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    revalidated = client.get("/", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+
+def test_yellowpages_etag_invalidated_by_moderation(client, db_session, test_user, admin_token):
+    """Ensure an admin delete bumps the listing ETag so stale 304s can't serve removed entries."""
+    entry = Entry(
+        title="Soon Removed",
+        url="https://stale.example",
+        notes="",
+        user_id=test_user.id,
+        is_public_copy=True,
+    )
+    db_session.add(entry)
+    db_session.commit()
+
+    response = client.get("/")
+    etag = response.headers["etag"]
+    assert "Soon Removed" in response.text
+
+    client.cookies.set("access_token", admin_token)
+    deleted = client.post(f"/admin/{entry.id}/delete")
+    assert deleted.status_code == 200
+    client.cookies.clear()
+
+    # The old validator no longer matches; the fresh page omits the entry.
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert "Soon Removed" not in response.text
+
+
 def test_rolodex_requires_login(client):
     """Ensure /rolodex is protected and returns 401 when not authenticated."""
     response = client.get("/rolodex")